@@ -15,7 +15,7 @@ from typing import Dict
 
 from deepchecks.core import CheckResult
 from deepchecks.core.reduce_classes import ReduceLabelMixin
-from deepchecks.tabular import Context, TrainTestCheck
+from deepchecks.tabular import Context, Dataset, TrainTestCheck
 from deepchecks.tabular.utils.task_type import TaskType
 from deepchecks.utils.abstracts.label_drift import LabelDriftAbstract
 
@@ -128,14 +128,23 @@ class LabelDrift(TrainTestCheck, LabelDriftAbstract, ReduceLabelMixin):
             value: drift score.
             display: label distribution graph, comparing the train and test distributions.
         """
-        train_dataset = context.train.sample(self.n_samples, random_state=self.random_state)
-        test_dataset = context.test.sample(self.n_samples, random_state=self.random_state)
+        train_dataset = self._maybe_sample(context.train)
+        test_dataset = self._maybe_sample(context.test)
+
+        train_label = train_dataset.label_col
+        test_label = test_dataset.label_col
 
         column_type = 'categorical' if context.task_type != TaskType.REGRESSION else 'numerical'
 
-        return self._calculate_label_drift(train_dataset.label_col, test_dataset.label_col, train_dataset.label_name,
+        return self._calculate_label_drift(train_label, test_label, train_dataset.label_name,
                                            column_type, context.with_display, (train_dataset.name, test_dataset.name))
 
+    def _maybe_sample(self, dataset: Dataset) -> Dataset:
+        """Sample the dataset only if it has more than n_samples samples, to avoid a redundant copy."""
+        if not dataset.is_sampled(self.n_samples):
+            return dataset
+        return dataset.sample(self.n_samples, random_state=self.random_state)
+
     def reduce_output(self, check_result: CheckResult) -> Dict[str, float]:
         """Return label drift score."""
         return {'Label Drift Score': check_result.value['Drift score']}
@@ -257,7 +257,7 @@ def kolmogorov_smirnov(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndar
     ----------
     dist1, dist2 : array_like, 1-Dimensional
         Two arrays of sample observations assumed to be drawn from a continuous
-        distribution, sample sizes can be different.
+        distribution, sample sizes can be different. Missing values are ignored.
 
     Returns
     -------
@@ -304,18 +304,26 @@ def kolmogorov_smirnov(dist1: Union[np.ndarray, pd.Series], dist2: Union[np.ndar
         dist1 = dist1.compressed()
     if np.ma.is_masked(dist2):
         dist2 = dist2.compressed()
-    dist1 = np.sort(dist1)
-    dist2 = np.sort(dist2)
+    dist1 = np.asarray(dist1)
+    dist2 = np.asarray(dist2)
+    dist1 = dist1[~pd.isna(dist1)]
+    dist2 = dist2[~pd.isna(dist2)]
     n1 = dist1.shape[0]
     n2 = dist2.shape[0]
     if min(n1, n2) == 0:
         raise ValueError('Data must not be empty')
 
+    # A single sort of the pooled sample replaces sorting each sample and then searching both of them. The empirical
+    # cdfs are the running counts of each sample's members along the pooled order.
     data_all = np.concatenate([dist1, dist2])
-    # using searchsorted solves equal data problem
-    cdf1 = np.searchsorted(dist1, data_all, side='right') / n1
-    cdf2 = np.searchsorted(dist2, data_all, side='right') / n2
-    cddiffs = np.abs(cdf1 - cdf2)
+    order = np.argsort(data_all)
+    data_all = data_all[order]
+    is_dist1 = order < n1
+    cdf1 = np.cumsum(is_dist1) / n1
+    cdf2 = np.cumsum(~is_dist1) / n2
+    # Only compare the cdfs at the last occurrence of each value, which solves the equal data problem
+    last_of_value = np.append(data_all[1:] != data_all[:-1], True)
+    cddiffs = np.abs(cdf1 - cdf2)[last_of_value]
     return np.max(cddiffs)
 
 
@@ -11,7 +11,8 @@
 """Test functions of the label drift."""
 import numpy as np
 import pandas as pd
-from hamcrest import assert_that, calling, close_to, equal_to, greater_than, has_entries, has_length, raises
+from hamcrest import (assert_that, calling, close_to, equal_to, greater_than, has_entries, has_length, raises,
+                      same_instance)
 
 from deepchecks.core.condition import ConditionCategory
 from deepchecks.core.errors import NotEnoughSamplesError
@@ -138,6 +139,21 @@ def test_drift_regression_label_ks(drifted_regression_label):
     ))
 
 
+def test_drift_label_not_sampled_when_dataset_fits_n_samples(drifted_regression_label):
+    # Arrange
+    train, _ = drifted_regression_label
+    check_fits = LabelDrift(n_samples=len(train))
+    check_smaller = LabelDrift(n_samples=len(train) // 2)
+
+    # Act
+    not_sampled = check_fits._maybe_sample(train)
+    sampled = check_smaller._maybe_sample(train)
+
+    # Assert
+    assert_that(not_sampled, same_instance(train))
+    assert_that(sampled.n_samples, equal_to(len(train) // 2))
+
+
 def test_reduce_output_drift_regression_label(drifted_regression_label):
     # Arrange
     train, test = drifted_regression_label
@@ -11,6 +11,7 @@
 """Test drift utils"""
 import numpy as np
 from hamcrest import assert_that, calling, close_to, equal_to, raises
+from scipy.stats import ks_2samp
 
 from deepchecks.core.errors import DeepchecksValueError
 from deepchecks.utils.distribution.drift import cramers_v, earth_movers_distance, kolmogorov_smirnov
@@ -229,3 +230,21 @@ def test_ks_regular_drift_scaled():
     dist2 = np.random.normal(1, 1, 10000) * 100
     res = kolmogorov_smirnov(dist1=dist1, dist2=dist2)
     assert_that(res, close_to(0.382, 0.01))
+
+
+def test_ks_matches_scipy_with_ties_and_different_sizes():
+    np.random.seed(42)
+    dist1 = np.random.randint(0, 20, 1000).astype(float)
+    dist2 = np.random.randint(5, 25, 300).astype(float)
+    res = kolmogorov_smirnov(dist1=dist1, dist2=dist2)
+    assert_that(res, close_to(ks_2samp(dist1, dist2).statistic, 1e-12))
+
+
+def test_ks_ignores_nans():
+    np.random.seed(42)
+    dist1 = np.random.normal(0, 1, 1000)
+    dist2 = np.random.normal(1, 1, 1000)
+    dist1_with_nans = np.concatenate([dist1, [np.nan] * 100])
+    dist2_with_nans = np.concatenate([[np.nan] * 10, dist2])
+    res = kolmogorov_smirnov(dist1=dist1_with_nans, dist2=dist2_with_nans)
+    assert_that(res, close_to(kolmogorov_smirnov(dist1=dist1, dist2=dist2), 1e-12))